@@ -91,14 +91,6 @@ def get_manifest():
 
 #################################################################
 
-for bp in conf.get('BLUEPRINTS'):
-    try:
-        print("Registering blueprint: '{}'".format(bp.name))
-        app.register_blueprint(bp)
-    except Exception as e:
-        print('blueprint registration failed')
-        logging.exception(e)
-
 if conf.get('SILENCE_FAB'):
     logging.getLogger('flask_appbuilder').setLevel(logging.ERROR)
 
@@ -138,6 +130,14 @@ if app.config.get('ENABLE_TIME_ROTATE'):
         backupCount=app.config.get('BACKUP_COUNT'))
     logging.getLogger().addHandler(handler)
 
+# Registered after the logging configuration so messages use LOG_FORMAT
+for bp in conf.get('BLUEPRINTS'):
+    try:
+        logging.info("Registering blueprint: '%s'", bp.name)
+        app.register_blueprint(bp)
+    except Exception:
+        logging.exception("Blueprint registration failed: '%s'", bp)
+
 if app.config.get('ENABLE_CORS'):
     from flask_cors import CORS
     CORS(app, **app.config.get('CORS_OPTIONS'))
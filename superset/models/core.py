@@ -512,11 +512,18 @@ class Dashboard(Model, AuditMixinNullable, ImportMixin):
         new_timed_refresh_immune_slices = []
         new_expanded_slices = {}
         i_params_dict = dashboard_to_import.params_dict
-        remote_id_slice_map = {
-            slc.params_dict['remote_id']: slc
-            for slc in session.query(Slice).all()
-            if 'remote_id' in slc.params_dict
-        }
+        filter_immune_slices = frozenset(
+            i_params_dict.get('filter_immune_slices') or ())
+        timed_refresh_immune_slices = frozenset(
+            i_params_dict.get('timed_refresh_immune_slices') or ())
+        expanded_slices = i_params_dict.get('expanded_slices') or {}
+
+        remote_id_slice_map = {}
+        for existing_slc in session.query(Slice).all():
+            # params_dict parses the params json on every access, parse it once
+            slc_params = existing_slc.params_dict
+            if 'remote_id' in slc_params:
+                remote_id_slice_map[slc_params['remote_id']] = existing_slc
         for slc in slices:
             logging.info('Importing slice {} from the dashboard: {}'.format(
                 slc.to_json(), dashboard_to_import.dashboard_title))
@@ -526,24 +533,20 @@ class Dashboard(Model, AuditMixinNullable, ImportMixin):
             # update json metadata that deals with slice ids
             new_slc_id_str = '{}'.format(new_slc_id)
             old_slc_id_str = '{}'.format(slc.id)
-            if ('filter_immune_slices' in i_params_dict and
-                    old_slc_id_str in i_params_dict['filter_immune_slices']):
+            if old_slc_id_str in filter_immune_slices:
                 new_filter_immune_slices.append(new_slc_id_str)
-            if ('timed_refresh_immune_slices' in i_params_dict and
-                    old_slc_id_str in
-                    i_params_dict['timed_refresh_immune_slices']):
+            if old_slc_id_str in timed_refresh_immune_slices:
                 new_timed_refresh_immune_slices.append(new_slc_id_str)
-            if ('expanded_slices' in i_params_dict and
-                    old_slc_id_str in i_params_dict['expanded_slices']):
+            if old_slc_id_str in expanded_slices:
                 new_expanded_slices[new_slc_id_str] = (
-                    i_params_dict['expanded_slices'][old_slc_id_str])
+                    expanded_slices[old_slc_id_str])
 
         # override the dashboard
         existing_dashboard = None
         for dash in session.query(Dashboard).all():
-            if ('remote_id' in dash.params_dict and
-                    dash.params_dict['remote_id'] ==
-                    dashboard_to_import.id):
+            dash_params = dash.params_dict
+            if ('remote_id' in dash_params and
+                    dash_params['remote_id'] == dashboard_to_import.id):
                 existing_dashboard = dash
 
         dashboard_to_import.id = None
@@ -581,14 +584,22 @@ class Dashboard(Model, AuditMixinNullable, ImportMixin):
     def export_dashboards(cls, dashboard_ids):
         copied_dashboards = []
         datasource_ids = set()
+        # make sure that dashboard ids are unique integers, and remember the
+        # requested order. Unknown ids are skipped.
+        positions = {}
         for dashboard_id in dashboard_ids:
-            # make sure that dashboard_id is an integer
-            dashboard_id = int(dashboard_id)
-            copied_dashboard = (
+            positions.setdefault(int(dashboard_id), len(positions))
+        dashboards = []
+        if positions:
+            dashboards = (
                 db.session.query(Dashboard)
                 .options(subqueryload(Dashboard.slices))
-                .filter_by(id=dashboard_id).first()
+                .filter(Dashboard.id.in_(list(positions)))
+                .all()
             )
+            dashboards.sort(key=lambda dash: positions[dash.id])
+        for copied_dashboard in dashboards:
+            dashboard_id = copied_dashboard.id
             make_transient(copied_dashboard)
             for slc in copied_dashboard.slices:
                 datasource_ids.add((slc.datasource_id, slc.datasource_type))
@@ -602,16 +613,16 @@ class Dashboard(Model, AuditMixinNullable, ImportMixin):
             copied_dashboard.alter_params(remote_id=dashboard_id)
             copied_dashboards.append(copied_dashboard)
 
-            eager_datasources = []
-            for dashboard_id, dashboard_type in datasource_ids:
-                eager_datasource = ConnectorRegistry.get_eager_datasource(
-                    db.session, dashboard_type, dashboard_id)
-                eager_datasource.alter_params(
-                    remote_id=eager_datasource.id,
-                    database_name=eager_datasource.database.name,
-                )
-                make_transient(eager_datasource)
-                eager_datasources.append(eager_datasource)
+        eager_datasources = []
+        for datasource_id, datasource_type in datasource_ids:
+            eager_datasource = ConnectorRegistry.get_eager_datasource(
+                db.session, datasource_type, datasource_id)
+            eager_datasource.alter_params(
+                remote_id=eager_datasource.id,
+                database_name=eager_datasource.database.name,
+            )
+            make_transient(eager_datasource)
+            eager_datasources.append(eager_datasource)
 
         return json.dumps({
             'dashboards': copied_dashboards,
@@ -30,6 +30,7 @@ import sqlalchemy as sqla
 from sqlalchemy import and_, create_engine, MetaData, or_, update
 from sqlalchemy.engine.url import make_url
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import load_only
 from unidecode import unidecode
 from werkzeug.routing import BaseConverter
 from werkzeug.utils import secure_filename
@@ -1718,10 +1719,14 @@ class Superset(BaseSupersetView):
         if 'filter_immune_slice_fields' not in md:
             md['filter_immune_slice_fields'] = {}
         md['expanded_slices'] = data['expanded_slices']
-        default_filters_data = json.loads(data.get('default_filters', '{}'))
-        applicable_filters = \
-            {key: v for key, v in default_filters_data.items()
-             if int(key) in slice_ids}
+        default_filters = data.get('default_filters')
+        applicable_filters = {}
+        # skip the json parsing when there are no default filters
+        if default_filters and default_filters != '{}':
+            default_filters_data = json.loads(default_filters)
+            applicable_filters = \
+                {key: v for key, v in default_filters_data.items()
+                 if int(key) in slice_ids}
         md['default_filters'] = json.dumps(applicable_filters)
         dashboard.json_metadata = json.dumps(md)
 
@@ -1988,6 +1993,7 @@ class Superset(BaseSupersetView):
         Slice = models.Slice  # noqa
         qry = (
             db.session.query(Slice)
+            .options(load_only('id', 'slice_name', 'changed_on', 'viz_type'))
             .filter(
                 sqla.or_(
                     Slice.created_by_fk == user_id,
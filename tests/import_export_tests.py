@@ -268,6 +268,19 @@ class ImportExportTests(SupersetTestCase):
         self.assert_table_equals(
             self.get_table_by_name('wb_health_population'), exported_tables[1])
 
+    def test_export_dashboards_dedup_and_unknown_ids(self):
+        birth_dash = self.get_dash_by_slug('births')
+        export_dash_url = (
+            '/dashboard/export_dashboards_form?id={}&id={}&id={}&action=go'
+            .format(birth_dash.id, birth_dash.id, 99999))
+        resp = self.client.get(export_dash_url)
+        exported_dashboards = json.loads(
+            resp.data.decode('utf-8'),
+            object_hook=utils.decode_dashboards,
+        )['dashboards']
+        self.assertEquals(1, len(exported_dashboards))
+        self.assert_dash_equals(birth_dash, exported_dashboards[0])
+
     def test_import_1_slice(self):
         expected_slice = self.create_slice('Import Me', id=10001)
         slc_id = models.Slice.import_obj(expected_slice, None, import_time=1989)